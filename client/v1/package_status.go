@@ -4,7 +4,6 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	"io"
 	"net/http"
 
 	"github.com/leptonai/gpud/pkg/gpud-manager/packages"
@@ -32,13 +31,8 @@ func GetPackageStatus(ctx context.Context, url string, opts ...OpOption) ([]pack
 		return nil, fmt.Errorf("unexpected status code %v received", resp.StatusCode)
 	}
 
-	rawBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
-
 	var ret []packages.PackageStatus
-	if err := json.Unmarshal(rawBody, &ret); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&ret); err != nil {
 		return nil, err
 	}
 	return ret, nil
@@ -11,6 +11,8 @@ import (
 	"net/http"
 	"net/url"
 	"strings"
+	"sync"
+	"time"
 
 	"sigs.k8s.io/yaml"
 
@@ -574,10 +576,20 @@ func ReadMetrics(rd io.Reader, opts ...OpOption) (v1.GPUdComponentMetrics, error
 	return metrics, nil
 }
 
-func createDefaultHTTPClient() *http.Client {
+// defaultHTTPClient is shared by all requests in this package, so that
+// keep-alive connections (and their TLS sessions) to the GPUd server
+// are reused across calls instead of being re-established per request.
+var defaultHTTPClient = sync.OnceValue(func() *http.Client {
 	return &http.Client{
 		Transport: &http.Transport{
-			TLSClientConfig: &tls.Config{InsecureSkipVerify: true},
+			TLSClientConfig:     &tls.Config{InsecureSkipVerify: true},
+			MaxIdleConns:        32,
+			MaxIdleConnsPerHost: 16,
+			IdleConnTimeout:     90 * time.Second,
 		},
 	}
+})
+
+func createDefaultHTTPClient() *http.Client {
+	return defaultHTTPClient()
 }
@@ -1098,3 +1098,14 @@ func TestTriggerComponentCheckByTag(t *testing.T) {
 		})
 	}
 }
+
+func TestCreateDefaultHTTPClientReused(t *testing.T) {
+	c1 := createDefaultHTTPClient()
+	c2 := createDefaultHTTPClient()
+	require.Same(t, c1, c2)
+
+	tr, ok := c1.Transport.(*http.Transport)
+	require.True(t, ok)
+	assert.True(t, tr.TLSClientConfig.InsecureSkipVerify)
+	assert.Equal(t, 16, tr.MaxIdleConnsPerHost)
+}